@@ -0,0 +1,31 @@
+"""Shared serial port name handling for the radar scripts."""
+
+import platform
+import re
+
+# The platform never changes at runtime; query it once at import time
+_IS_WINDOWS = platform.system() == 'Windows'
+
+_DIGITS = re.compile(r'\d+')
+
+def normalize_port(port: str) -> str:
+    """
+    Normalize port name to appropriate format based on platform and input.
+    Handles both Windows (COM*) and Linux (/dev/tty*) style ports.
+    """
+    # If port is just a number, convert to appropriate format
+    if port.isdigit():
+        return f'COM{port}' if _IS_WINDOWS else f'/dev/ttyACM{int(port)-1}'
+
+    # If it's already in the correct format, return as is
+    if _IS_WINDOWS:
+        return port if port.upper().startswith('COM') else f'COM{port}'
+    else:
+        if port.upper().startswith('COM'):
+            # Convert Windows style to Linux style
+            num = int(_DIGITS.search(port).group()) - 1
+            return f'/dev/ttyACM{num}'
+        elif not port.startswith('/dev/'):
+            # Assume it's a Linux port number
+            return f'/dev/ttyACM{int(port)-1}'
+        return port
@@ -1,16 +1,67 @@
 #!/usr/bin/env python3
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
 from xep_radar_connector import XEPRadarConnector, RadarConfig
+from _port_utils import normalize_port
 from datetime import datetime
+import atexit
+import functools
+import math
 import os
-import platform
 import argparse
+import queue
+import threading
 import time
 
+# Optional Numba JIT of the per-frame DSP kernel. rocket-fft teaches Numba
+# about np.fft, so abs/subtract/rfft/magnitude/phase fuse into one compiled
+# pass writing into preallocated buffers. Falls back to plain NumPy when
+# either package is unavailable.
+try:
+    import numba as nb
+    import rocket_fft  # noqa: F401  (registers np.fft support with numba)
+
+    @nb.njit(cache=True, fastmath=True)
+    def _process_frame_kernel(raw, frame_out, mag_out, phase_out):
+        """Fused abs/subtract/rfft/magnitude/phase kernel; returns argmax bin"""
+        for i in range(raw.size):
+            frame_out[i] = abs(raw[i]) - 255.0
+        Y = np.fft.rfft(frame_out)
+        max_idx = 0
+        for i in range(Y.size):
+            m = abs(Y[i])
+            mag_out[i] = m
+            phase_out[i] = math.degrees(math.atan2(Y[i].imag, Y[i].real))
+            if m > mag_out[max_idx]:
+                max_idx = i
+        return max_idx
+
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+@functools.lru_cache(maxsize=8)
+def _frequency_axis(frame_size, fs):
+    """Full FFT frequency axis in GHz, cached per (frame_size, fs)"""
+    freq_bin = np.arange(0, frame_size) - frame_size/2
+    freq_bin = freq_bin * fs / frame_size
+    axis = freq_bin*2.0/(100.0/78.0)
+    axis.setflags(write=False)  # cached result is shared; keep it immutable
+    return axis
+
+@functools.lru_cache(maxsize=8)
+def _frequency_axis_rfft(frame_size, fs):
+    """Positive-only frequency axis matching np.fft.rfft, cached"""
+    freq_bin = np.arange(0, frame_size // 2 + 1)
+    freq_bin = freq_bin * fs / frame_size
+    axis = freq_bin*2.0/(100.0/78.0)
+    axis.setflags(write=False)
+    return axis
+
 class RadarVisualizer:
+    MAX_LOG_FRAMES = 65536  # binary log capacity (~55 min at 20 Hz)
+    FLUSH_EVERY = 64        # frames between memmap flushes
+
     def __init__(self, port: str):
         """Initialize RadarVisualizer with port"""
         self.config = RadarConfig(com_port=port)
@@ -27,12 +78,17 @@ class RadarVisualizer:
         
     def initialize_plots(self):
         """Initialize matplotlib plots with proper configuration"""
+        # matplotlib is imported lazily so the data-only path never pays
+        # its import and font-cache cost
+        import matplotlib.pyplot as plt
+        self._plt = plt
+
         self.fig, self.axes = plt.subplots(3, 1, figsize=(10, 12))
         frame_size = self.radar.samplers_per_frame
         
         # Time domain plot
         ax1 = self.axes[0]
-        h1 = ax1.plot(range(frame_size), np.zeros(frame_size))[0]
+        h1 = ax1.plot(range(frame_size), np.zeros(frame_size, dtype=np.float32))[0]
         ax1.set_title('Radar Time Waveform')
         ax1.set_xlabel('Bin')
         ax1.set_ylabel('Amplitude')
@@ -41,10 +97,11 @@ class RadarVisualizer:
         ax1.grid(True)
         self.lines.append(h1)
         
-        # FFT magnitude plot
-        f = self.calculate_frequency_axis(frame_size)
+        # FFT magnitude plot (rfft output: positive frequencies only)
+        self.f_pos = self.calculate_frequency_axis_rfft(frame_size)
+        rfft_size = frame_size // 2 + 1
         ax2 = self.axes[1]
-        h2 = ax2.plot(f, np.zeros(frame_size))[0]
+        h2 = ax2.plot(self.f_pos, np.zeros(rfft_size, dtype=np.float32))[0]
         ax2.set_title('FFT of the Signal')
         ax2.set_xlabel('Frequency (GHz)')
         ax2.set_ylabel('Magnitude')
@@ -52,10 +109,14 @@ class RadarVisualizer:
         ax2.set_ylim([0, 550])
         ax2.grid(True)
         self.lines.append(h2)
+        # Per-frame max-frequency readout lives inside the axes so blitting
+        # stays on the fast path (updating the title forces a full redraw)
+        self._fft_label = ax2.text(0.98, 0.95, '', transform=ax2.transAxes,
+                                   ha='right', va='top')
         
         # Phase plot
         ax3 = self.axes[2]
-        h3 = ax3.plot(f, np.zeros(frame_size))[0]
+        h3 = ax3.plot(self.f_pos, np.zeros(rfft_size, dtype=np.float32))[0]
         ax3.set_title('Phase of the Signal')
         ax3.set_xlabel('Frequency (GHz)')
         ax3.set_ylabel('Angle (degrees)')
@@ -63,53 +124,71 @@ class RadarVisualizer:
         ax3.set_ylim([-180, 180])
         ax3.grid(True)
         self.lines.append(h3)
-        
+
+        # Preallocated DSP output buffers reused on every frame
+        self._frame_buf = np.empty(frame_size, dtype=np.float32)
+        self._mag_buf = np.empty(rfft_size, dtype=np.float32)
+        self._phase_buf = np.empty(rfft_size, dtype=np.float32)
+
         plt.tight_layout()
         
     def calculate_frequency_axis(self, frame_size):
         """Calculate frequency axis for FFT plots"""
-        freq_bin = np.arange(0, frame_size) - frame_size/2
-        freq_bin = freq_bin * self.Fs / frame_size
-        return freq_bin*2.0/(100.0/78.0)
-        
+        return _frequency_axis(frame_size, self.Fs)
+
+    def calculate_frequency_axis_rfft(self, frame_size):
+        """Calculate positive-only frequency axis matching np.fft.rfft output"""
+        return _frequency_axis_rfft(frame_size, self.Fs)
+
     def update_plots(self, frame):
         """Update all plots with new frame data"""
         try:
-            # Get frame data and process
-            frame_data = np.abs(self.radar.get_frame_normalized())
-            frame_data = frame_data - 255  # Match MATLAB processing
-            
-            # Calculate FFT
-            Y = np.fft.fft(frame_data)
-            f = self.calculate_frequency_axis(len(frame_data))
-            
+            # Keep the whole DSP chain at 32 bits: the device emits float32
+            # and rfft then stays on pocketfft's float32/complex64 path
+            raw = self.radar.get_frame_normalized().astype(np.float32, copy=False)
+
+            if _HAVE_NUMBA:
+                # One fused pass: abs/subtract/rfft/magnitude/phase/argmax
+                max_idx = _process_frame_kernel(raw, self._frame_buf,
+                                                self._mag_buf, self._phase_buf)
+                frame_data = self._frame_buf
+                fft_mag = self._mag_buf
+                phase = self._phase_buf
+            else:
+                # Match MATLAB processing, in place to avoid two temporaries
+                np.abs(raw, out=raw)
+                np.subtract(raw, 255, out=raw)
+                frame_data = raw
+                Y = np.fft.rfft(frame_data)
+                fft_mag = np.abs(Y)
+                # One pass over Y instead of np.angle's three, reusing the
+                # preallocated phase buffer
+                np.arctan2(Y.imag, Y.real, out=self._phase_buf)
+                np.multiply(self._phase_buf, 180.0 / np.pi, out=self._phase_buf)
+                phase = self._phase_buf
+                max_idx = np.argmax(fft_mag)
+
             # Update time domain plot
             self.lines[0].set_ydata(frame_data)
-            
+
             # Update FFT magnitude plot
-            fft_mag = np.abs(Y)
             self.lines[1].set_ydata(fft_mag)
-            
-            # Update max frequency in title
-            half = len(f) // 2
-            max_idx = np.argmax(fft_mag[half:]) + half
-            self.axes[1].set_title(f'FFT of the Signal: {abs(f[max_idx]):.1f} GHz, max: {fft_mag[max_idx]:.1f}')
-            
+
+            # Update max frequency readout
+            self._fft_label.set_text(f'{self.f_pos[max_idx]:.1f} GHz, max: {fft_mag[max_idx]:.1f}')
+
             # Update phase plot
-            self.lines[2].set_ydata(np.angle(Y, deg=True))
-            
+            self.lines[2].set_ydata(phase)
+
             # Log data
-            timestamp = datetime.now().strftime('%H:%M:%S.%f')
-            frame_str = ' '.join(map(str, frame_data))
-            with open(self.get_log_filename(), 'a') as f:
-                f.write(f"{timestamp} {frame_str}\n")
-            
-            return self.lines
-            
+            self.log_frame(frame_data)
+
+            return self.lines + [self._fft_label]
+
         except Exception as e:
             print(f"Error updating plots: {e}")
-            plt.close()
-            return self.lines
+            self._plt.close()
+            return self.lines + [self._fft_label]
             
     def configure_radar(self):
         """Configure radar parameters to match MATLAB settings"""
@@ -121,28 +200,84 @@ class RadarVisualizer:
         self.radar.update_chip("tx_power", 3)
             
     def get_log_filename(self):
-        """Get the current log filename"""
+        """Get the base name for the current session's log files"""
         if not hasattr(self, 'log_file'):
             start_time = datetime.now()
             self.log_file = os.path.join(self.base_dir,
-                                       f'{start_time.strftime("%m_%d_%H%M%S")}_continuous.txt')
-            print(f"Saving data to: {self.log_file}")
+                                       f'{start_time.strftime("%m_%d_%H%M%S")}_continuous')
+            print(f"Saving data to: {self.log_file}.i16")
         return self.log_file
-            
+
+    def open_log(self):
+        """Create the binary log memmaps on first use
+
+        Frames are stored as int16 rows of a memory-mapped
+        (MAX_LOG_FRAMES, frame_size) array; per-frame timestamps go to a
+        side memmap of int64 epoch microseconds. Bytes flow straight
+        from NumPy to the page cache with no text formatting.
+        """
+        if not hasattr(self, '_mm'):
+            base = self.get_log_filename()
+            frame_size = self.radar.samplers_per_frame
+            self._mm = np.memmap(f'{base}.i16', mode='w+', dtype=np.int16,
+                                 shape=(self.MAX_LOG_FRAMES, frame_size))
+            self._mm_ts = np.memmap(f'{base}_ts.i64', mode='w+', dtype=np.int64,
+                                    shape=(self.MAX_LOG_FRAMES,))
+            self._log_idx = 0
+            # One wall-clock anchor per session; per-frame timestamps are
+            # integer perf_counter_ns offsets from it
+            self._ts_anchor_us = int(datetime.now().timestamp() * 1e6)
+            self._ts_anchor_ns = time.perf_counter_ns()
+            # Disk writes happen on a background thread; the bounded queue
+            # applies backpressure to acquisition if the disk stalls
+            self._log_q = queue.Queue(maxsize=256)
+            threading.Thread(target=self._writer_loop, daemon=True).start()
+            atexit.register(self._mm.flush)
+            atexit.register(self._mm_ts.flush)
+
+    def log_frame(self, frame_data):
+        """Queue one frame and its timestamp for the background log writer"""
+        self.open_log()
+        ts = self._ts_anchor_us + \
+            (time.perf_counter_ns() - self._ts_anchor_ns) // 1000
+        # astype copies, so the caller is free to reuse its frame buffer
+        self._log_q.put((ts, frame_data.astype(np.int16)))
+
+    def _writer_loop(self):
+        """Drain queued frames into the binary log memmaps"""
+        while True:
+            ts, frame = self._log_q.get()
+            idx = self._log_idx
+            if idx >= self.MAX_LOG_FRAMES:
+                if idx == self.MAX_LOG_FRAMES:
+                    print("Log capacity reached; no further frames will be recorded")
+                    self._log_idx += 1
+                self._log_q.task_done()
+                continue
+            self._mm[idx] = frame
+            self._mm_ts[idx] = ts
+            self._log_idx = idx + 1
+            if self._log_idx % self.FLUSH_EVERY == 0:
+                self._mm.flush()
+                self._mm_ts.flush()
+            self._log_q.task_done()
+
     def start_visualization(self):
         """Start continuous data visualization"""
+        from matplotlib.animation import FuncAnimation
+
         self.initialize_plots()
-        
+
         # Create animation for real-time updates
         self.animation = FuncAnimation(
             self.fig,
             self.update_plots,
             interval=50,  # 50ms update interval
             blit=True,
-            save_count=100  # Limit frame cache to last 100 frames
+            cache_frame_data=False  # Live display; retain nothing for saving
         )
-        
-        plt.show()
+
+        self._plt.show()
         
     def collect_data_only(self, duration=None):
         """Collect data without visualization
@@ -151,63 +286,61 @@ class RadarVisualizer:
             duration: Optional duration in seconds to collect data. If None, runs until interrupted.
         """
         print(f"Starting data collection without visualization...")
-        print(f"Saving data to: {self.get_log_filename()}")
-        
-        start_time = time.time()
+        self.open_log()
+
+        # Frame size is constant per session, so compute the axis once
+        frame_size = self.radar.samplers_per_frame
+        f = self.calculate_frequency_axis_rfft(frame_size)
+
+        # Accumulate frames and batch the FFT/logging every M frames
+        M = 16
+        buf = np.empty((M, frame_size), dtype=np.float32)
+        i = 0
+        max_freq = 0.0
+        max_mag = 0.0
+
+        # Monotonic clock for status cadence and the duration check; the
+        # old int(time.time()) % 5 test also reset start_time on every
+        # status print, which broke the duration cutoff below
+        t0 = time.perf_counter()
+        next_status = t0 + 5.0
         try:
             while True:
                 # Get frame data and process
-                frame_data = np.abs(self.radar.get_frame_normalized())
-                frame_data = frame_data - 255  # Match MATLAB processing
-                
-                # Calculate FFT (for logging purposes)
-                Y = np.fft.fft(frame_data)
-                f = self.calculate_frequency_axis(len(frame_data))
-                
-                # Find max frequency
-                fft_mag = np.abs(Y)
-                half = len(f) // 2
-                max_idx = np.argmax(fft_mag[half:]) + half
-                max_freq = abs(f[max_idx])
-                
-                # Log data
-                timestamp = datetime.now().strftime('%H:%M:%S.%f')
-                frame_str = ' '.join(map(str, frame_data))
-                with open(self.get_log_filename(), 'a') as f:
-                    f.write(f"{timestamp} {frame_str}\n")
-                
-                # Print status every second
-                if int(time.time()) > int(start_time) and int(time.time()) % 5 == 0:
-                    print(f"Collecting data... Max frequency: {max_freq:.1f} GHz, max magnitude: {fft_mag[max_idx]:.1f}")
-                    start_time = time.time()
-                
+                # Match MATLAB processing, written straight into the batch row
+                np.abs(self.radar.get_frame_normalized(), out=buf[i])
+                np.subtract(buf[i], 255, out=buf[i])
+                self.log_frame(buf[i])
+                i += 1
+
+                if i == M:
+                    i = 0
+                    # One batched FFT over all M frames (for logging purposes)
+                    Y = np.fft.rfft(buf, axis=1)
+                    fft_mag = np.abs(Y)
+                    max_idx = np.argmax(fft_mag[-1])
+                    max_freq = f[max_idx]
+                    max_mag = fft_mag[-1, max_idx]
+
+                # Print status every 5 seconds
+                now = time.perf_counter()
+                if now >= next_status:
+                    print(f"Collecting data... Max frequency: {max_freq:.1f} GHz, max magnitude: {max_mag:.1f}")
+                    next_status = now + 5.0
+
                 # Check if duration is specified and elapsed
-                if duration and (time.time() - start_time) > duration:
+                if duration and (now - t0) > duration:
                     print(f"Collection completed after {duration} seconds")
                     break
-                    
-                # Small delay to prevent CPU overload
-                time.sleep(0.05)
                 
         except KeyboardInterrupt:
             print("Data collection stopped by user")
         except Exception as e:
             print(f"Error during data collection: {e}")
-
-def normalize_port(port: str) -> str:
-    """Normalize port name based on platform"""
-    if port.isdigit():
-        return f'COM{port}' if platform.system() == 'Windows' else f'/dev/ttyACM{int(port)-1}'
-    
-    if platform.system() == 'Windows':
-        return port if port.upper().startswith('COM') else f'COM{port}'
-    else:
-        if port.upper().startswith('COM'):
-            num = int(''.join(filter(str.isdigit, port))) - 1
-            return f'/dev/ttyACM{num}'
-        elif not port.startswith('/dev/'):
-            return f'/dev/ttyACM{int(port)-1}'
-        return port
+        finally:
+            self._log_q.join()
+            self._mm.flush()
+            self._mm_ts.flush()
 
 def main():
     # Parse command line arguments
@@ -219,7 +352,11 @@ def main():
     parser.add_argument('--duration', type=int, default=None,
                         help='Duration in seconds to collect data (default: run until interrupted)')
     args = parser.parse_args()
-    
+
+    # Headless backend in case anything pulls matplotlib in without a display
+    if args.no_visual:
+        os.environ.setdefault('MPLBACKEND', 'Agg')
+
     # Use provided port
     normalized_port = normalize_port(args.port)
     visualizer = RadarVisualizer(normalized_port)
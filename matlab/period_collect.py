@@ -2,11 +2,12 @@
 
 import numpy as np
 from xep_radar_connector import XEPRadarConnector, RadarConfig
-from datetime import datetime
+from _port_utils import normalize_port
+from datetime import datetime, timedelta
 import os
 import sys
-import platform
 import argparse
+import time
 from threading import Event
 
 class PracticalRadarTest:
@@ -15,8 +16,6 @@ class PracticalRadarTest:
         self.config = RadarConfig(com_port=port)
         self.radar = None
         
-        # Ensure results directory exists
-        os.makedirs('results', exist_ok=True)
         # Ensure results directory exists
         self.base_dir = 'results'
         os.makedirs(self.base_dir, exist_ok=True)
@@ -28,10 +27,10 @@ class PracticalRadarTest:
         
     def initialize_reference_frame(self):
         """Initialize reference frame by averaging 10 frames"""
-        frame_sum = np.zeros(self.radar.samplers_per_frame)
-        for _ in range(10):
-            frame_sum += np.abs(self.radar.get_frame_normalized())
-        self.frame_0 = np.floor(frame_sum / 10)
+        buf = np.empty((10, self.radar.samplers_per_frame))
+        for i in range(10):
+            np.abs(self.radar.get_frame_normalized(), out=buf[i])
+        self.frame_0 = np.floor(buf.mean(axis=0))
             
     def configure_radar(self):
         """Configure radar parameters to match MATLAB settings"""
@@ -50,34 +49,25 @@ class PracticalRadarTest:
                                f'{start_time.strftime("%m_%d_%H%M%S")}_data.txt')
         print(f"Saving data to: {data_file}")
         
+        # Anchor wall-clock time once; per-frame timestamps are derived from
+        # monotonic perf_counter_ns offsets instead of datetime.now() calls
+        anchor_wall = datetime.now()
+        anchor_ns = time.perf_counter_ns()
+
         try:
-            import time
             print("Press Ctrl+C to stop data acquisition")
             while True:
-                frame_data = np.abs(self.radar.get_frame_normalized()) - 255
-                timestamp = datetime.now().strftime('%H:%M:%S.%f')
+                frame_data = self.radar.get_frame_normalized()
+                np.abs(frame_data, out=frame_data)
+                np.subtract(frame_data, 255, out=frame_data)
+                dt_ns = time.perf_counter_ns() - anchor_ns
+                timestamp = (anchor_wall + timedelta(microseconds=dt_ns // 1000)).strftime('%H:%M:%S.%f')
                 frame_str = ' '.join(map(str, frame_data))
                 with open(data_file, 'a') as f:
                     f.write(f"{timestamp} {frame_str}\n")
-                time.sleep(0.05)  # 50ms interval, similar to previous animation
         except KeyboardInterrupt:
             print("\nData acquisition stopped by user")
 
-def normalize_port(port: str) -> str:
-    """Normalize port name based on platform"""
-    if port.isdigit():
-        return f'COM{port}' if platform.system() == 'Windows' else f'/dev/ttyACM{int(port)-1}'
-    
-    if platform.system() == 'Windows':
-        return port if port.upper().startswith('COM') else f'COM{port}'
-    else:
-        if port.upper().startswith('COM'):
-            num = int(''.join(filter(str.isdigit, port))) - 1
-            return f'/dev/ttyACM{num}'
-        elif not port.startswith('/dev/'):
-            return f'/dev/ttyACM{int(port)-1}'
-        return port
-
 def run_practical_test(port: str, timestamp=None, stop_event=None,
                        collect_duration: float = 2.0, interval: float = 10.0, total_duration: float = 30.0):
     """Run practical radar test
@@ -109,7 +99,6 @@ def run_practical_test(port: str, timestamp=None, stop_event=None,
                     radar_test.start_acquisition()
                 # Option 2: Periodic data collection
                 else:
-                    import time
                     start_time = time.time()
                     round_num = 0
                     
@@ -125,14 +114,21 @@ def run_practical_test(port: str, timestamp=None, stop_event=None,
                         print(f"\nStarting collection round {round_num + 1}")
                         print(f"Saving to: {round_file}")
                         
-                        # Collect data for collect_duration seconds
+                        # Collect data for collect_duration seconds; anchor
+                        # wall-clock once per round and timestamp frames from
+                        # monotonic offsets
+                        anchor_wall = datetime.now()
+                        anchor_ns = time.perf_counter_ns()
                         collection_end = round_start + collect_duration
                         while time.time() < collection_end:
                             if stop_event and stop_event.is_set():
                                 break
-                                
-                            frame_data = np.abs(radar.get_frame_normalized()) - 255
-                            timestamp = datetime.now().strftime('%H:%M:%S.%f')
+
+                            frame_data = radar.get_frame_normalized()
+                            np.abs(frame_data, out=frame_data)
+                            np.subtract(frame_data, 255, out=frame_data)
+                            dt_ns = time.perf_counter_ns() - anchor_ns
+                            timestamp = (anchor_wall + timedelta(microseconds=dt_ns // 1000)).strftime('%H:%M:%S.%f')
                             frame_str = ' '.join(map(str, frame_data))
                             with open(round_file, 'a') as f:
                                 f.write(f"{timestamp} {frame_str}\n")
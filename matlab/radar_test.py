@@ -4,8 +4,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from xep_radar_connector import XEPRadarConnector, RadarConfig
+from _port_utils import normalize_port
 import sys
-import platform
 
 class RadarTest:
     def __init__(self, port: str):
@@ -21,19 +21,33 @@ class RadarTest:
         """Initialize matplotlib plot with proper configuration"""
         self.fig, self.ax = plt.subplots(figsize=(10, 6))
         frame_size = self.radar.samplers_per_frame
-        self.line, = self.ax.plot(range(frame_size), np.zeros(frame_size))
-        
+        # animated=True keeps the line out of normal draws so blitting only
+        # re-rasterizes it instead of the whole axes. The line keeps this
+        # one buffer for its ydata; updates copy into it rather than
+        # handing matplotlib a fresh array every frame
+        # float32 end to end: the device emits float32 and the connector
+        # keeps it that way, so a float64 buffer would just double the
+        # bytes copied per frame
+        self._ydata_buf = np.zeros(frame_size, dtype=np.float32)
+        self.line, = self.ax.plot(range(frame_size), self._ydata_buf,
+                                  animated=True)
+
         self.ax.set_title('Radar Time Waveform')
         self.ax.set_xlabel('Bin')
         self.ax.set_ylabel('Amplitude')
+        # Fix both axis ranges so autoscaling never invalidates the cached
+        # blit background
+        self.ax.set_xlim(0, frame_size - 1)
         self.ax.set_ylim([0, 15])  # Set y-axis range for normalized amplitude
         self.ax.grid(True)
         
     def update_plot(self, frame):
         """Update plot with new frame data"""
         try:
-            frame_data = np.abs(self.radar.get_frame_normalized())
-            self.line.set_ydata(frame_data)
+            frame_data = self.radar.peek_latest()
+            if frame_data is not None:
+                np.copyto(self._ydata_buf, frame_data)
+                self.line.set_ydata(self._ydata_buf)
             return self.line,
         except Exception as e:
             print(f"Error updating plot: {e}")
@@ -51,41 +65,23 @@ class RadarTest:
     def start_acquisition(self):
         """Start real-time data acquisition and plotting"""
         self.initialize_plot()
-        
+
+        # Acquire frames on a background thread so the GUI never blocks
+        # on the serial round-trip
+        self.radar.start_reader()
+
         # Create animation for real-time updates
         self.animation = FuncAnimation(
             self.fig,
             self.update_plot,
             interval=50,  # 50ms update interval
             blit=True,
-            save_count=100  # Limit frame cache to last 100 frames
+            cache_frame_data=False  # Live display; retain nothing for saving
         )
         
         # Show plot (blocks until window is closed)
         plt.show()
 
-def normalize_port(port: str) -> str:
-    """
-    Normalize port name to appropriate format based on platform and input.
-    Handles both Windows (COM*) and Linux (/dev/tty*) style ports.
-    """
-    # If port is just a number, convert to appropriate format
-    if port.isdigit():
-        return f'COM{port}' if platform.system() == 'Windows' else f'/dev/ttyACM{int(port)-1}'
-    
-    # If it's already in the correct format, return as is
-    if platform.system() == 'Windows':
-        return port if port.upper().startswith('COM') else f'COM{port}'
-    else:
-        if port.upper().startswith('COM'):
-            # Convert Windows style to Linux style
-            num = int(''.join(filter(str.isdigit, port))) - 1
-            return f'/dev/ttyACM{num}'
-        elif not port.startswith('/dev/'):
-            # Assume it's a Linux port number
-            return f'/dev/ttyACM{int(port)-1}'
-        return port
-
 def run_radar_test(port: str):
     """Run radar test"""
     normalized_port = normalize_port(port)
@@ -1,5 +1,7 @@
 import logging
+import math
 import platform
+import threading
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional, Union, List
@@ -8,6 +10,20 @@ import serial.tools.list_ports
 import numpy as np
 from contextlib import contextmanager
 
+# Optional SIMD/parallel magnitude kernel for large I/Q frames; the plain
+# np.hypot path is used when numba is not installed.
+try:
+    import numba as _nb
+
+    @_nb.njit(cache=True, fastmath=True, parallel=True)
+    def _mag_kernel(iq, out):
+        for i in _nb.prange(out.shape[0]):
+            out[i] = math.sqrt(iq[i, 0] * iq[i, 0] + iq[i, 1] * iq[i, 1])
+
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
 class RadarError(Exception):
     """Base exception for radar-related errors."""
     pass
@@ -28,7 +44,10 @@ class ProtocolError(RadarError):
 class RadarConfig:
     """Configuration parameters for the radar connection."""
     com_port: str
-    baudrate: int = 115200
+    # The usual XEP link is USB-CDC, where bulk transfers ignore the
+    # nominal rate; a high default avoids capping genuine UART bridges
+    # at ~11.5 kB/s (one DDC frame per second)
+    baudrate: int = 3_000_000
     timeout: float = 5.0
     retry_attempts: int = 20
     packet_version: int = 0  # 0 for legacy, 1 for v2
@@ -83,7 +102,15 @@ class PacketType(Enum):
 
 class XEPRadarConnector:
     """Python implementation of X4 radar communication."""
-    
+
+    # Registers whose value changes the sampler count / frame layout;
+    # only these require re-querying SamplersPerFrame after a write
+    _DIRTIES_SAMPLERS = {'ddc_en', 'DownConvert', 'frame_start', 'frame_end', 'PPS'}
+
+    # Hot-path commands, encoded once instead of per call
+    _CMD_GET_FRAME_NORMALIZED = b"GetFrameNormalized()\n"
+    _CMD_GET_FRAME_RAW = b"GetFrameRaw()\n"
+
     def __init__(self, config: RadarConfig):
         """Initialize the radar connector with given configuration."""
         self.config = config
@@ -96,6 +123,22 @@ class XEPRadarConnector:
         
         # Connection object
         self._serial = None
+
+        # Reusable receive buffer, sized once the frame layout is known
+        self._frame_buf = bytearray(8)
+
+        # Background frame reader (started on demand); the newest frame
+        # lives in a single lock-protected slot, latest wins
+        self._reader_thread = None
+        self._reader_stop = None
+        self._latest_frame = None
+        self._latest_lock = threading.Lock()
+
+        # True while a pipelined frame request is in flight
+        self._pipeline_primed = False
+
+        # True while the module is emitting frames without being asked
+        self._streaming = False
         
         # Initialize connection
         self._connect()
@@ -113,6 +156,15 @@ class XEPRadarConnector:
                 # Set control signals
                 self._serial.dtr = True
                 self._serial.rts = True
+
+                # Enlarge the driver ring buffers where supported (Windows)
+                # so bulk frame reads are not fragmented
+                if hasattr(self._serial, 'set_buffer_size'):
+                    try:
+                        self._serial.set_buffer_size(rx_size=1 << 20,
+                                                     tx_size=1 << 16)
+                    except (serial.SerialException, ValueError):
+                        pass
                 
                 # Initialize handle
                 self._write_command("NVA_CreateHandle()")
@@ -134,11 +186,68 @@ class XEPRadarConnector:
         self._is_open = True
         self._update_samplers()
 
+    def start_reader(self) -> None:
+        """Start a background thread that continually acquires frames.
+
+        Decouples serial I/O from the consumer (typically a GUI loop):
+        the newest frame magnitude overwrites a single slot, so stale
+        frames are dropped and the consumer always sees the latest.
+        """
+        if self._reader_thread is not None:
+            return
+        self._reader_stop = threading.Event()
+        self._latest_frame = None
+        self._reader_thread = threading.Thread(target=self._reader_loop,
+                                               daemon=True)
+        self._reader_thread.start()
+
+    def stop_reader(self) -> None:
+        """Stop the background frame reader if it is running."""
+        if self._reader_thread is None:
+            return
+        self._reader_stop.set()
+        self._reader_thread.join()
+        self._reader_thread = None
+
+    def peek_latest(self) -> Optional[np.ndarray]:
+        """Return the newest acquired frame, or None if nothing is pending."""
+        with self._latest_lock:
+            frame = self._latest_frame
+            self._latest_frame = None
+        return frame
+
+    def _reader_loop(self) -> None:
+        """Continually acquire frames and publish the newest one."""
+        while not self._reader_stop.is_set():
+            try:
+                if self._streaming:
+                    # Streaming mode: the device pushes frames on its own
+                    frame = self._frame_magnitude(
+                        self._read_frame(PacketType.NORMALIZED))
+                else:
+                    frame = self._frame_magnitude(self._read_frame_pipelined())
+            except RadarError as e:
+                self.logger.warning(f"Frame reader stopping: {e}")
+                break
+            # Latest wins: overwrite whatever the consumer has not taken
+            with self._latest_lock:
+                self._latest_frame = frame
+
     def close(self) -> None:
         """Close radar connection."""
+        self.stop_reader()
+        if self._streaming:
+            self.stop_streaming()
+        if self._pipeline_primed:
+            # Drain the in-flight frame so Close() gets a clean link
+            try:
+                self._read_frame(PacketType.NORMALIZED)
+            except RadarError:
+                pass
+            self._pipeline_primed = False
         if not self._is_open:
             return
-            
+
         self._write_command("Close()")
         self._read_response()
         self._is_open = False
@@ -148,16 +257,93 @@ class XEPRadarConnector:
 
     def get_frame_raw(self) -> np.ndarray:
         """Get raw frame data from radar."""
-        self._write_command("GetFrameRaw()")
+        self._write_bytes(self._CMD_GET_FRAME_RAW)
         frame = self._read_frame(PacketType.RAW)
         return self._process_frame(frame)
 
     def get_frame_normalized(self) -> np.ndarray:
-        """Get normalized frame data from radar."""
-        self._write_command("GetFrameNormalized()")
+        """Get normalized frame data from radar.
+
+        The returned array is a writable view over the connector's
+        receive buffer; it is overwritten by the next frame read, so
+        copy it if it needs to outlive that.
+        """
+        self._write_bytes(self._CMD_GET_FRAME_NORMALIZED)
         frame = self._read_frame(PacketType.NORMALIZED)
         return self._process_frame(frame)
 
+    def get_frame_magnitude(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Get the magnitude of a normalized frame in one pass.
+
+        With the down-converter enabled this computes np.hypot directly
+        over the interleaved I/Q floats instead of building an
+        intermediate complex array and taking its absolute value. Pass a
+        preallocated array as ``out`` to avoid a per-frame allocation.
+        """
+        self._write_bytes(self._CMD_GET_FRAME_NORMALIZED)
+        frame = self._read_frame(PacketType.NORMALIZED)
+        return self._frame_magnitude(frame, out=out)
+
+    def get_frame_normalized_pipelined(self) -> np.ndarray:
+        """Get a normalized frame while keeping one request in flight.
+
+        The next GetFrameNormalized() command is written as soon as the
+        current frame has been read, so the device prepares the following
+        frame while the host is still processing this one. Do not mix
+        with other commands on the same link without an intervening
+        close()/stop_reader().
+        """
+        return self._process_frame(self._read_frame_pipelined())
+
+    def start_streaming(self, fps: int) -> None:
+        """Put the module in continuous streaming mode.
+
+        The XEP firmware then emits frames at the requested rate with no
+        per-frame GetFrame* request, turning the link into a pure data
+        pipe; pull them with read_streamed_frame(). The background reader
+        also picks this mode up automatically.
+        """
+        self._write_command(f"VarSetValue_ByName(StreamFPS,{fps})")
+        self._read_response()
+        self._streaming = True
+
+    def stop_streaming(self) -> None:
+        """Return the module to request/response operation."""
+        if not self._streaming:
+            return
+        self._write_command("VarSetValue_ByName(StreamFPS,0)")
+        self._streaming = False
+        # Frames already in flight are interleaved with the command ACK;
+        # drop everything pending so the next response parses cleanly
+        self._serial.reset_input_buffer()
+
+    def read_streamed_frame(self) -> np.ndarray:
+        """Read the next frame emitted in streaming mode."""
+        return self._process_frame(self._read_frame(PacketType.NORMALIZED))
+
+    def _read_frame_pipelined(self) -> memoryview:
+        """Read a frame, pre-issuing the request for the next one."""
+        if not self._pipeline_primed:
+            self._write_bytes(self._CMD_GET_FRAME_NORMALIZED)
+            self._pipeline_primed = True
+        frame = self._read_frame(PacketType.NORMALIZED)
+        self._write_bytes(self._CMD_GET_FRAME_NORMALIZED)
+        return frame
+
+    def _frame_magnitude(self, frame: memoryview,
+                         out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Magnitude of a raw frame payload in a single pass."""
+        data = np.frombuffer(frame, dtype=np.float32)
+        if self._x4_down_converter:
+            iq = data.reshape(-1, 2)
+            if _HAVE_NUMBA:
+                if out is None:
+                    out = np.empty(iq.shape[0], dtype=np.float32)
+                _mag_kernel(iq, out)
+                return out
+            return np.hypot(iq[:, 0], iq[:, 1], out=out)
+        return np.abs(data, out=out)
+
     def update_chip(self, register_name: str, value: Union[int, float]) -> None:
         """Update register value on the radar chip."""
         if register_name in ['ddc_en', 'DownConvert']:
@@ -166,57 +352,78 @@ class XEPRadarConnector:
         cmd = f"VarSetValue_ByName({register_name},{value})"
         self._write_command(cmd)
         self._read_response()
-        self._update_samplers()
+        if register_name in self._DIRTIES_SAMPLERS:
+            self._update_samplers()
 
     def _write_command(self, command: str) -> None:
         """Write command to serial port."""
+        self._write_bytes(command.encode() + b'\n')
+
+    def _write_bytes(self, data: bytes) -> None:
+        """Write a pre-encoded command to the serial port."""
         if not self._serial:
             raise ConnectionError("Serial connection not established")
-        self._serial.write(command.encode() + b'\n')
+        self._serial.write(data)
 
     def _read_response(self) -> bytes:
         """Read and validate response from radar."""
-        response = bytearray()
-        while True:
-            if not self._serial.in_waiting:
-                continue
-                
-            byte = self._serial.read()
-            response.extend(byte)
-            
-            if len(response) >= 5 and response[-5:] == b'<ACK>':
-                return response[:-5]
-                
-            if len(response) >= 5 and response[:5] == b'<ERR>':
-                error_msg = response[5:].decode().strip()
-                raise ProtocolError(f"Radar error: {error_msg}")
-
-    def _read_frame(self, packet_type: PacketType) -> bytes:
-        """Read a frame from the radar."""
-        frame_data = bytearray()
-        while True:
-            if not self._serial.in_waiting:
-                continue
-                
-            byte = self._serial.read()
-            frame_data.extend(byte)
-            
-            # Check for frame end marker
-            if len(frame_data) >= 5 and frame_data[-5:] == b'<ACK>':
-                return frame_data[:-5]
-                
-            if len(frame_data) >= 5 and frame_data[:5] == b'<ERR>':
-                error_msg = frame_data[5:].decode().strip()
-                raise ProtocolError(f"Radar error during frame read: {error_msg}")
+        response = self._serial.read_until(b'<ACK>')
+        if response.startswith(b'<ERR>'):
+            error_msg = self._strip_ack(response[5:]).decode().strip()
+            raise ProtocolError(f"Radar error: {error_msg}")
+        if not response.endswith(b'<ACK>'):
+            raise TimeoutError("Timed out waiting for radar response")
+        return response[:-5]
 
-    def _process_frame(self, frame: bytes) -> np.ndarray:
-        """Process raw frame data into numpy array."""
-        data = np.frombuffer(frame, dtype=np.float32)
-        
+    def _read_frame(self, packet_type: PacketType) -> memoryview:
+        """Read a frame from the radar.
+
+        The payload size is known from the sampler count, so the frame is
+        pulled in bulk reads instead of byte-at-a-time polling. The
+        returned memoryview aliases the connector's receive buffer and is
+        invalidated by the next frame read.
+        """
+        expected = self._frame_nbytes()
+        if len(self._frame_buf) < expected:
+            # A register write changed the frame size; regrow once
+            self._frame_buf = bytearray(expected + 8)
+        mv = memoryview(self._frame_buf)
+
+        # Peek the first bytes to catch an error reply before committing to
+        # a fixed-size payload read
+        got = self._serial.readinto(mv[:min(5, expected)])
+        if mv[:5] == b'<ERR>':
+            error_msg = self._strip_ack(self._serial.read_until(b'<ACK>')).decode().strip()
+            raise ProtocolError(f"Radar error during frame read: {error_msg}")
+
+        if got == min(5, expected):
+            got += self._serial.readinto(mv[got:expected])
+        if got < expected:
+            raise TimeoutError("Timed out reading frame data")
+
+        ack = self._serial.read_until(b'<ACK>')
+        if not ack.endswith(b'<ACK>'):
+            raise TimeoutError("Timed out waiting for frame end marker")
+        # Zero copy: numpy views are built directly on the receive buffer
+        return mv[:expected]
+
+    def _frame_nbytes(self) -> int:
+        """Size of one frame payload in bytes."""
+        return self._num_samplers * 4 * (2 if self._x4_down_converter else 1)
+
+    @staticmethod
+    def _strip_ack(data: bytes) -> bytes:
+        """Remove a trailing <ACK> marker if present."""
+        return data[:-5] if data.endswith(b'<ACK>') else data
+
+    def _process_frame(self, frame: memoryview) -> np.ndarray:
+        """Wrap a raw frame payload as a numpy view, without copying."""
         if self._x4_down_converter:
-            # Convert to complex I/Q data
-            return data[::2] + 1j * data[1::2]
-        return data
+            # The device sends interleaved float32 I/Q pairs, which is
+            # exactly the complex64 memory layout: reinterpret the bytes
+            # instead of gathering strided halves into a complex128 copy
+            return np.frombuffer(frame, dtype=np.complex64)
+        return np.frombuffer(frame, dtype=np.float32)
 
     def _update_samplers(self) -> None:
         """Update the number of samplers from radar."""
@@ -224,6 +431,11 @@ class XEPRadarConnector:
         response = self._read_response()
         self._num_samplers = int(response.decode())
 
+        # Keep the receive buffer in step with the frame layout
+        nbytes = self._frame_nbytes()
+        if len(self._frame_buf) < nbytes + 8:
+            self._frame_buf = bytearray(nbytes + 8)
+
     @contextmanager
     def connection(self, connect_string: str):
         """Context manager for radar connection."""